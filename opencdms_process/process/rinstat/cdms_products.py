@@ -38,25 +38,83 @@ Each wrapper function:
   - Has a parameter list that is  as close as possible to the equivalent R 
     function's parameter list.
   - Returns it's result as a platform independent object, typically a Python 
-    pandas data frame, or a link to a JPEG file.
+    pandas data frame, or a link to an image file.
   - Has a similar structure. First it converts the Python parameters (as 
     needed) into R equivalent data types used by `rpy2`. It calls the R 
     function. If needed, it converts the returned result into a Python data 
     type.
 """
-from typing import Dict, List
-
-from numpy import integer
-from pandas import DataFrame, to_datetime
+import os
+import tempfile
+import warnings
+from functools import lru_cache
+from io import BytesIO
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
+
+import numpy
+from pandas import DataFrame, Series, concat, to_datetime
+from pandas.api.types import is_datetime64_any_dtype
 from rpy2.robjects import NULL as r_NULL
-from rpy2.robjects import (NA_Character, NA_Logical, conversion,
-                           default_converter, globalenv, packages, pandas2ri,
-                           r)
+from rpy2.robjects import (NA_Character, NA_Logical, NA_Real, conversion,
+                           default_converter, packages, pandas2ri, r)
+from rpy2.rinterface import FloatSexpVector, StrSexpVector
 from rpy2.robjects.vectors import DataFrame as RDataFrame
 from rpy2.robjects.vectors import FloatVector, ListVector, StrVector
 
-r_cdms_products = packages.importr("cdms.products")
-r_ggplot2 = packages.importr("ggplot2")
+if TYPE_CHECKING:
+    from PIL import Image
+
+# 'pyarrow' is optional. If available, Arrow tables are accepted as input.
+try:
+    import pyarrow
+    import pyarrow.compute
+except ImportError:
+    pyarrow = None
+
+# 'rpy2-arrow' is optional. If available, Arrow tables are passed to R in the
+# Arrow format, which is much faster than the pure Python 'pandas2ri'. pandas
+# data frames are always converted by 'pandas2ri', so R receives the same data
+# whether or not Arrow is installed.
+try:
+    from rpy2_arrow.arrow import pyarrow_table_to_r_table, rarrow_to_py_table
+
+    __HAS_RPY2_ARROW = True
+except ImportError:
+    __HAS_RPY2_ARROW = False
+
+# combining converters builds a new converter, so only do it once
+pandas_converter = default_converter + pandas2ri.converter
+
+
+def as_r_data_frame(
+    data: DataFrame, date_time: str = None, to_date: bool = True
+) -> RDataFrame:
+    """Convert a data frame into R format, ready to pass to several wrappers.
+
+    Converting the data frame is often the slowest part of calling a wrapper.
+    If the same data frame is passed to several wrappers (e.g. exported by
+    `export_cdt`, `export_cdt_daily` and `export_climdex`, or plotted for each
+    element), then it can be converted once by this function and the R data
+    frame passed to each wrapper instead.
+
+    Args:
+        data: The data frame to convert.
+        date_time: The name of the date column in 'data'. If the dates do not
+          include timezone data, then they are set to UTC.
+        to_date: If True, all date-times are converted into R 'Date' format,
+          as expected by the export functions and `inventory_plot`. Set to
+          False for `histogram_plot` and `timeseries_plot`.
+
+    Returns:
+        The data frame in rpy2 R format.
+    """
+    # If dates in data frame do not include timezone data, then set to UTC
+    if date_time is not None:
+        data = __set_utc(data, date_time)
+
+    if to_date:
+        return __get_r_data_frame_with_dates(data)
+    return __get_r_params({"data": data})["data"]
 
 
 def climatic_extremes(
@@ -71,18 +129,18 @@ def climatic_extremes(
     to: str = "hourly",
     by: List[str] = [],
     doy: str = None,
-    doy_first: integer = 1,
-    doy_last: integer = 366,
+    doy_first: int = 1,
+    doy_last: int = 366,
     max_val: bool = True,
     min_val: bool = False,
     first_date: bool = False,
     n_dates: bool = False,
     last_date: bool = False,
     na_rm: bool = False,
-    na_prop: integer = None,
-    na_n: integer = None,
-    na_consec: integer = None,
-    na_n_non: integer = None,
+    na_prop: float = None,
+    na_n: int = None,
+    na_consec: int = None,
+    na_n_non: int = None,
     names="{.fn}_{.col}",
 ) -> DataFrame:
     """Calculate extremes from climatic data.
@@ -131,34 +189,11 @@ def climatic_extremes(
         A summary data frame containing minimum/maximum values for element(s).
     """
     # If dates in data frame do not include timezone data, then set to UTC
-    data[date_time] = to_datetime(data[date_time], utc=True)
+    data = __set_utc(data, date_time)
 
     r_params: Dict = __get_r_params(locals())
-    r_data_frame: RDataFrame = r_cdms_products.climatic_extremes(
-        data=r_params["data"],
-        date_time=r_params["date_time"],
-        elements=r_params["elements"],
-        station=r_params["station"],
-        year=r_params["year"],
-        month=r_params["month"],
-        dekad=r_params["dekad"],
-        pentad=r_params["pentad"],
-        to=r_params["to"],
-        by=r_params["by"],
-        doy=r_params["doy"],
-        doy_first=r_params["doy_first"],
-        doy_last=r_params["doy_last"],
-        max_val=r_params["max_val"],
-        min_val=r_params["min_val"],
-        first_date=r_params["first_date"],
-        n_dates=r_params["n_dates"],
-        last_date=r_params["last_date"],
-        na_rm=r_params["na_rm"],
-        na_prop=r_params["na_prop"],
-        na_n=r_params["na_n"],
-        na_consec=r_params["na_consec"],
-        na_n_non=r_params["na_n_non"],
-        names=r_params["names"],
+    r_data_frame: RDataFrame = __r_cdms_products_function("climatic_extremes")(
+        **r_params
     )
     return __get_data_frame(r_data_frame)
 
@@ -191,22 +226,17 @@ def climatic_missing(
         Data frame summarising the missing data.
     """
     # If dates in data frame do not include timezone data, then set to UTC
-    data[date_time] = to_datetime(data[date_time], utc=True)
+    data = __set_utc(data, date_time)
 
     r_params: Dict = __get_r_params(locals())
-    r_data_frame: RDataFrame = r_cdms_products.climatic_missing(
-        data=r_params["data"],
-        date_time=r_params["date_time"],
-        elements=r_params["elements"],
-        station_id=r_params["station_id"],
-        start=r_params["start"],
-        end=r_params["end"],
+    r_data_frame: RDataFrame = __r_cdms_products_function("climatic_missing")(
+        **r_params
     )
     return __get_data_frame(r_data_frame)
 
 
 def climatic_summary(
-    data: DataFrame,
+    data: Union[DataFrame, RDataFrame, "pyarrow.Table"],
     date_time: str,
     station: str = None,
     elements: List[str] = [],
@@ -217,27 +247,34 @@ def climatic_summary(
     to: str = "hourly",
     by: List[str] = [],
     doy: str = None,
-    doy_first: integer = 1,
-    doy_last: integer = 366,
+    doy_first: int = 1,
+    doy_last: int = 366,
     summaries: Dict[str, str] = {"n": "dplyr::n"},
     na_rm: bool = False,
-    na_prop: integer = None,
-    na_n: integer = None,
-    na_consec: integer = None,
-    na_n_non: integer = None,
+    na_prop: float = None,
+    na_n: int = None,
+    na_consec: int = None,
+    na_n_non: int = None,
     first_date: bool = False,
     n_dates: bool = False,
     last_date: bool = False,
     summaries_params: Dict[str, Dict] = {},
     names: str = "{.fn}_{.col}",
-) -> DataFrame:
+    as_r: bool = False,
+    as_arrow: bool = False,
+) -> Union[DataFrame, RDataFrame, "pyarrow.Table"]:
     """Calculate summaries from climatic data.
 
     Returns a data table displaying summary statistics for element(s)
     (and for each station) in a given time period.
+    To calculate summaries for many data frames (e.g. one per station), use
+    `climatic_summary_batch`, which passes all the data to R in a single call.
 
     Args:
-        data: The data frame to calculate from.
+        data: The data frame to calculate from. This may also be an R format
+          data frame, e.g. returned by another wrapper with 'as_r' set to True,
+          or a 'pyarrow.Table', which is passed to R without copying when
+          Arrow is available.
         date_time: The name of the date column in 'data'.
         station: The name of the station column in 'data', if the data are
           for multiple stations.
@@ -275,59 +312,140 @@ def climatic_summary(
         summaries_params: Additional parameters to pass to 'summaries'. Must be
           a list of lists with the same names as 'summaries'.
         names: Format of column names. Passed to '.names' in 'dplyr::across'.
+        as_r: If True, the result is returned as an R format data frame. This
+          avoids converting the result to Python if it is only going to be
+          passed to another wrapper function.
+        as_arrow: If True, the result is returned as a 'pyarrow.Table' rather
+          than a pandas data frame. Requires the 'rpy2-arrow' Python package
+          and the 'arrow' R package.
 
     Returns:
         A summary data frame for selected element(s) in climatic data.
     """
     # If dates in data frame do not include timezone data, then set to UTC
-    data[date_time] = to_datetime(data[date_time], utc=True)
+    data = __set_utc(data, date_time)
 
     r_params: Dict = __get_r_params(locals())
+    r_params["summaries_params"] = __summaries_params_to_r(summaries_params)
 
-    r_params["summaries"] = StrVector(list(summaries.values()))
-    r_params["summaries"].names = list(summaries.keys())
-
-    # summaries_params: convert to a 2-level deep R-type:
-    #   one list item for each summary function, and one list of parameters for
-    #   each summary function e.g. 'list(mean = list(trim = 0.5))'
-    r_summaries_params: Dict[str, list] = {}
-    for key in summaries_params:
-        r_summaries_params[key] = ListVector(summaries_params[key])
-        r_summaries_params[key].names = list(summaries_params[key].keys())
-    r_params["summaries_params"] = ListVector(r_summaries_params)
-    r_params["summaries_params"].names = list(summaries_params.keys())
-
-    r_data_frame: RDataFrame = r_cdms_products.climatic_summary(
-        data=r_params["data"],
-        date_time=r_params["date_time"],
-        station=r_params["station"],
-        elements=r_params["elements"],
-        year=r_params["year"],
-        month=r_params["month"],
-        dekad=r_params["dekad"],
-        pentad=r_params["pentad"],
-        to=r_params["to"],
-        by=r_params["by"],
-        doy=r_params["doy"],
-        doy_first=r_params["doy_first"],
-        doy_last=r_params["doy_last"],
-        summaries=r_params["summaries"],
-        na_rm=r_params["na_rm"],
-        na_prop=r_params["na_prop"],
-        na_n=r_params["na_n"],
-        na_consec=r_params["na_consec"],
-        na_n_non=r_params["na_n_non"],
-        first_date=r_params["first_date"],
-        n_dates=r_params["n_dates"],
-        last_date=r_params["last_date"],
-        summaries_params=r_params["summaries_params"],
-        names=r_params["names"],
+    # all the other parameters are passed to R with the same names
+    del r_params["as_r"], r_params["as_arrow"]
+    r_data_frame: RDataFrame = __r_cdms_products_function("climatic_summary")(
+        **r_params
     )
-    return __get_data_frame(r_data_frame)
+    if as_r:
+        return r_data_frame
+    return __get_data_frame(r_data_frame, as_arrow)
+
+
+def climatic_summary_batch(
+    data: Union[DataFrame, RDataFrame, "pyarrow.Table", Dict[object, DataFrame]],
+    group_col: str,
+    as_r: bool = False,
+    as_arrow: bool = False,
+    split: bool = False,
+    chunk_groups: int = None,
+    **kwargs,
+) -> Union[DataFrame, RDataFrame, "pyarrow.Table", Dict[object, DataFrame]]:
+    """Calculate summaries from climatic data, separately for each group.
+
+    Equivalent to calling `climatic_summary` once for each value of
+    'group_col' (e.g. once per station) and combining the results. However,
+    'data' is only passed to R once. R splits the data and calculates the
+    summary for each group, and the combined result is only converted back to
+    Python once.
+    If the 'future.apply' R package is installed, then the groups are
+    summarised using 'future.apply::future_lapply', so they may be calculated
+    in parallel by setting a 'future::plan()' in R (e.g. 'multisession').
+
+    Args:
+        data: The data frame to calculate from, in Python, Arrow or R format.
+          This may also be a dictionary of pandas data frames (e.g. one for
+          each station), which are combined into a single data frame with the
+          dictionary keys in a new 'group_col' column.
+        group_col: The name of the column in 'data' to split the data by.
+        as_r: If True, the result is returned as an R format data frame.
+        as_arrow: If True, the result is returned as a 'pyarrow.Table'.
+        split: If True, the result is split back into one pandas data frame
+          for each group. Cannot be combined with 'as_r' or 'as_arrow'.
+          Always True if 'data' is a dictionary and neither 'as_r' nor
+          'as_arrow' are set.
+        chunk_groups: If set, a pandas 'data' is passed to R in chunks of this
+          many groups, rather than all at once. This limits the peak memory
+          used for very large data frames, at the cost of one R call per
+          chunk.
+        kwargs: The parameters to pass to `climatic_summary` for each group,
+          e.g. 'date_time', 'elements' and 'summaries'.
+
+    Returns:
+        A summary data frame for all the groups. If the summaries do not
+        include 'group_col', then it is added as the first column. If 'split'
+        is True, a dictionary that maps each value of 'group_col' to the
+        summary data frame for that group.
+    """
+    if split and (as_r or as_arrow):
+        raise ValueError("'split' cannot be combined with 'as_r' or 'as_arrow'.")
+
+    keys: List = None
+    if isinstance(data, dict):
+        split = not (as_r or as_arrow)
+        if split:
+            # label each group by its position, so that the results can be
+            # mapped back to the original keys, whatever their type
+            keys = list(data)
+            groups = enumerate(data.values())
+        else:
+            groups = data.items()
+        data = concat(
+            [frame.assign(**{group_col: key}) for key, frame in groups],
+            ignore_index=True,
+        )
+
+    # If dates in data frame do not include timezone data, then set to UTC
+    if "date_time" in kwargs:
+        data = __set_utc(data, kwargs["date_time"])
+
+    r_kwargs: Dict = __get_r_params(kwargs)
+    if "summaries_params" in kwargs:
+        r_kwargs["summaries_params"] = __summaries_params_to_r(
+            kwargs["summaries_params"]
+        )
+    r_args = ListVector(r_kwargs)
+
+    if chunk_groups is None or not isinstance(data, DataFrame):
+        r_data_frame: RDataFrame = __r_climatic_summary_batch()(
+            __get_r_params({"data": data})["data"], group_col, r_args
+        )
+    else:
+        # only one chunk at a time is held in R format
+        groups = sorted(data[group_col].dropna().unique())
+        r_summaries: Dict[str, RDataFrame] = {}
+        for start in range(0, len(groups), chunk_groups):
+            chunk = data[data[group_col].isin(groups[start : start + chunk_groups])]
+            r_summaries[str(start)] = __r_climatic_summary_batch()(
+                __get_r_params({"data": chunk})["data"], group_col, r_args
+            )
+        r_data_frame = __r_bind_rows()(ListVector(r_summaries))
+    if as_r:
+        return r_data_frame
+    if not split:
+        return __get_data_frame(r_data_frame, as_arrow)
+
+    data_frame: DataFrame = __get_data_frame(r_data_frame)
+    if keys is None:
+        return {
+            key: group.reset_index(drop=True)
+            for key, group in data_frame.groupby(group_col, sort=False)
+        }
+    results: Dict = {}
+    for index, group in data_frame.groupby(group_col, sort=False):
+        key = keys[int(index)]
+        results[key] = group.assign(**{group_col: key}).reset_index(drop=True)
+    return results
 
 
 def export_cdt(
-    data: DataFrame,
+    data: Union[DataFrame, RDataFrame],
     station: str,
     element: str,
     latitude: str,
@@ -349,6 +467,7 @@ def export_cdt(
     Args:
         data: Data frame of daily or dekadal climatic data in tidy format
           i.e. one row per time point (per station) and one column per element.
+          This may also be an R format data frame from `as_r_data_frame`.
         station: Name of the station identifying column in 'data'.
         element: Name of the element column in 'data'.
         latitude: Name of the latitude column in 'metadata'.
@@ -377,30 +496,16 @@ def export_cdt(
         Nothing.
     """
     # If dates in data frame do not include timezone data, then set to UTC
-    data[date_time] = to_datetime(data[date_time], utc=True)
+    data = __set_utc(data, date_time)
 
+    data = __get_r_data_frame_with_dates(data)
     r_params: Dict = __get_r_params(locals())
-    r_params["data"] = __convert_posixt_to_r_date(r_params["data"])
-
-    r_cdms_products.export_cdt(
-        data=r_params["data"],
-        station=r_params["station"],
-        element=r_params["element"],
-        latitude=r_params["latitude"],
-        longitude=r_params["longitude"],
-        altitude=r_params["altitude"],
-        type=r_params["type"],
-        date_time=r_params["date_time"],
-        year=r_params["year"],
-        month=r_params["month"],
-        dekad=r_params["dekad"],
-        metadata=r_params["metadata"],
-        file_path=r_params["file_path"],
-    )
+
+    __r_cdms_products_function("export_cdt")(**r_params)
 
 
 def export_cdt_daily(
-    data: DataFrame,
+    data: Union[DataFrame, RDataFrame],
     station: str,
     element: str,
     date_time: str,
@@ -420,6 +525,7 @@ def export_cdt_daily(
     Args:
         data: Data frame of daily climatic data in tidy format
           i.e. one row per day (per station) and one column per element.
+          This may also be an R format data frame from `as_r_data_frame`.
         station: Name of the station identifying column in 'data'.
         element: Name of the element column in 'data'.
         date_time: Name of the date column in 'data'.
@@ -438,27 +544,16 @@ def export_cdt_daily(
         Nothing.
     """
     # If dates in data frame do not include timezone data, then set to UTC
-    data[date_time] = to_datetime(data[date_time], utc=True)
+    data = __set_utc(data, date_time)
 
+    data = __get_r_data_frame_with_dates(data)
     r_params: Dict = __get_r_params(locals())
-    r_params["data"] = __convert_posixt_to_r_date(r_params["data"])
-
-    r_cdms_products.export_cdt_daily(
-        data=r_params["data"],
-        station=r_params["station"],
-        element=r_params["element"],
-        date_time=r_params["date_time"],
-        latitude=r_params["latitude"],
-        longitude=r_params["longitude"],
-        type=r_params["type"],
-        altitude=r_params["altitude"],
-        metadata=r_params["metadata"],
-        file_path=r_params["file_path"],
-    )
+
+    __r_cdms_products_function("export_cdt_daily")(**r_params)
 
 
 def export_cdt_dekad(
-    data: DataFrame,
+    data: Union[DataFrame, RDataFrame],
     station: str,
     element: str,
     date_time: str,
@@ -481,6 +576,7 @@ def export_cdt_dekad(
         data: Data frame of dekadal climatic data in tidy
           format i.e. one row per dekad (per station) and one column
           per element.
+          This may also be an R format data frame from `as_r_data_frame`.
         station: Name of the station identifying column in 'data'.
         element: Name of the element column in 'data'.
         date_time: Name of the date column in 'data'. If 'type' is 'daily',
@@ -508,29 +604,16 @@ def export_cdt_dekad(
         Nothing.
     """
     # If dates in data frame do not include timezone data, then set to UTC
-    data[date_time] = to_datetime(data[date_time], utc=True)
+    data = __set_utc(data, date_time)
 
+    data = __get_r_data_frame_with_dates(data)
     r_params: Dict = __get_r_params(locals())
-    r_params["data"] = __convert_posixt_to_r_date(r_params["data"])
-
-    r_cdms_products.export_cdt_dekad(
-        data=r_params["data"],
-        station=r_params["station"],
-        element=r_params["element"],
-        date_time=r_params["date_time"],
-        latitude=r_params["latitude"],
-        longitude=r_params["longitude"],
-        altitude=r_params["altitude"],
-        year=r_params["year"],
-        month=r_params["month"],
-        dekad=r_params["dekad"],
-        metadata=r_params["metadata"],
-        file_path=r_params["file_path"],
-    )
+
+    __r_cdms_products_function("export_cdt_dekad")(**r_params)
 
 
 def export_climat_messages(
-    data: DataFrame,
+    data: Union[DataFrame, RDataFrame],
     date_time: str,
     station_id: str,
     folder: str,
@@ -554,6 +637,7 @@ def export_climat_messages(
 
     Args:
         data: The data frame to calculate from.
+          This may also be an R format data frame from `as_r_data_frame`.
         date_time: The name of the date column in 'data'.
         station_id: The name of the station column in 'data'.
         folder: TODO
@@ -575,34 +659,16 @@ def export_climat_messages(
         Nothing.
     """
     # If dates in data frame do not include timezone data, then set to UTC
-    data[date_time] = to_datetime(data[date_time], utc=True)
+    data = __set_utc(data, date_time)
 
-    r_params: Dict = __get_r_params(locals())
-    r_params["data"] = __convert_posixt_to_r_date(r_params["data"])
-
-    r_cdms_products.export_climat_messages(
-        data=r_params["data"],
-        date_time=r_params["date_time"],
-        station_id=r_params["station_id"],
-        year=r_params["year"],
-        month=r_params["month"],
-        mean_pressure_station=r_params["mean_pressure_station"],
-        mean_pressure_reduced=r_params["mean_pressure_reduced"],
-        mean_temp=r_params["mean_temp"],
-        mean_max_temp=r_params["mean_max_temp"],
-        mean_min_temp=r_params["mean_min_temp"],
-        mean_vapour_pressure=r_params["mean_vapour_pressure"],
-        total_precip=r_params["total_precip"],
-        total_sunshine=r_params["total_sunshine"],
-        total_snow_depth=r_params["total_snow_depth"],
-        max_ws=r_params["max_ws"],
-        min_h_vis=r_params["min_h_vis"],
-        folder=r_params["folder"],
-    )
+    data = __get_r_data_frame_with_dates(data)
+    r_params: Dict = __get_r_scalar_params(locals())
+
+    __r_cdms_products_function("export_climat_messages")(**r_params)
 
 
 def export_climdex(
-    data: DataFrame,
+    data: Union[DataFrame, RDataFrame],
     prcp: str,
     tmax: str,
     tmin: str,
@@ -612,6 +678,7 @@ def export_climdex(
     month: str = None,
     day: str = None,
     file_type: str = "csv",
+    use_r: bool = False,
 ):
     """Export data in the format for RClimDex.
 
@@ -621,6 +688,7 @@ def export_climdex(
     Args:
         data: Data frame of daily climatic data in tidy format
           i.e. one row per day and one column per element.
+          This may also be an R format data frame from `as_r_data_frame`.
         prcp: Name of the precipitation/rainfall column in 'data'.
         tmax: Name of the maximum temperature column in 'data'.
         tmin: Name of the minimum temperature column in 'data'.
@@ -634,29 +702,35 @@ def export_climdex(
           be created using 'lubridate::day(data[[date]])'.
         file_type: The file type to export as either 'csv' or 'txt'.
         file_path: The file path and file name to export.
+        use_r: If False, a 'csv' file for a pandas data frame with a 'date'
+          column (and no 'year', 'month' or 'day' columns) is written directly
+          by pandas, without passing the data to R. If True, the file is
+          always written by 'cdms.products::export_climdex'.
 
     Returns:
         Nothing.
     """
     # If dates in data frame do not include timezone data, then set to UTC
     if date is not None:
-        data[date] = to_datetime(data[date], utc=True)
+        data = __set_utc(data, date)
 
-    r_params: Dict = __get_r_params(locals())
-    r_params["data"] = __convert_posixt_to_r_date(r_params["data"])
-
-    r_cdms_products.export_climdex(
-        data=r_params["data"],
-        prcp=r_params["prcp"],
-        tmax=r_params["tmax"],
-        tmin=r_params["tmin"],
-        date=r_params["date"],
-        year=r_params["year"],
-        month=r_params["month"],
-        day=r_params["day"],
-        file_type=r_params["file_type"],
-        file_path=r_params["file_path"],
-    )
+    if (
+        not use_r
+        and isinstance(data, DataFrame)
+        and date is not None
+        and year is None
+        and month is None
+        and day is None
+        and file_type == "csv"
+    ):
+        __write_climdex_csv(data, date, prcp, tmax, tmin, file_path)
+        return
+
+    data = __get_r_data_frame_with_dates(data)
+    r_params: Dict = __get_r_scalar_params(locals())
+    del r_params["use_r"]
+
+    __r_cdms_products_function("export_climdex")(**r_params)
 
 
 def export_geoclim(
@@ -700,20 +774,7 @@ def export_geoclim(
         Nothing.
     """
     r_params: Dict = __get_r_params(locals())
-    r_cdms_products.export_geoclim(
-        data=r_params["data"],
-        year=r_params["year"],
-        type_col=r_params["type_col"],
-        element=r_params["element"],
-        station_id=r_params["station_id"],
-        latitude=r_params["latitude"],
-        longitude=r_params["longitude"],
-        type=r_params["type"],
-        metadata=r_params["metadata"],
-        join_by=r_params["join_by"],
-        add_cols=r_params["add_cols"],
-        file_path=r_params["file_path"],
-    )
+    __r_cdms_products_function("export_geoclim")(**r_params)
 
 
 def export_geoclim_dekad(
@@ -756,19 +817,7 @@ def export_geoclim_dekad(
         Nothing.
     """
     r_params: Dict = __get_r_params(locals())
-    r_cdms_products.export_geoclim_dekad(
-        data=r_params["data"],
-        year=r_params["year"],
-        dekad=r_params["dekad"],
-        element=r_params["element"],
-        station_id=r_params["station_id"],
-        latitude=r_params["latitude"],
-        longitude=r_params["longitude"],
-        metadata=r_params["metadata"],
-        join_by=r_params["join_by"],
-        add_cols=r_params["add_cols"],
-        file_path=r_params["file_path"],
-    )
+    __r_cdms_products_function("export_geoclim_dekad")(**r_params)
 
 
 def export_geoclim_month(
@@ -813,19 +862,7 @@ def export_geoclim_month(
         Nothing.
     """
     r_params: Dict = __get_r_params(locals())
-    r_cdms_products.export_geoclim_month(
-        data=r_params["data"],
-        year=r_params["year"],
-        month=r_params["month"],
-        element=r_params["element"],
-        station_id=r_params["station_id"],
-        latitude=r_params["latitude"],
-        longitude=r_params["longitude"],
-        metadata=r_params["metadata"],
-        join_by=r_params["join_by"],
-        add_cols=r_params["add_cols"],
-        file_path=r_params["file_path"],
-    )
+    __r_cdms_products_function("export_geoclim_month")(**r_params)
 
 
 def export_geoclim_pentad(
@@ -868,25 +905,13 @@ def export_geoclim_pentad(
         Nothing.
     """
     r_params: Dict = __get_r_params(locals())
-    r_cdms_products.export_geoclim_pentad(
-        data=r_params["data"],
-        year=r_params["year"],
-        pentad=r_params["pentad"],
-        element=r_params["element"],
-        station_id=r_params["station_id"],
-        latitude=r_params["latitude"],
-        longitude=r_params["longitude"],
-        metadata=r_params["metadata"],
-        join_by=r_params["join_by"],
-        add_cols=r_params["add_cols"],
-        file_path=r_params["file_path"],
-    )
+    __r_cdms_products_function("export_geoclim_pentad")(**r_params)
 
 
 def histogram_plot(
     path: str,
     file_name: str,
-    data: DataFrame,
+    data: Union[DataFrame, RDataFrame],
     date_time: str,
     elements: List[str],
     station: str = None,
@@ -902,17 +927,21 @@ def histogram_plot(
     title: str = "Histogram Plot",
     x_title: str = None,
     y_title: str = None,
+    device: str = "jpeg",
 ):
     """Produce a histogram of elements by station.
 
     Creates a histogram using 'ggplot2' for each element and station given.
     Takes a data frame as an input and the relevant columns to create the plot.
-    Writes the histogram to a JPEG file.
+    Writes the histogram to an image file, in the format set by 'device'.
 
     Args:
-        path: The location to write the JPEG output file.
-        file_name: The name of the JPEG output file.
-        data: The data frame to calculate from.
+        path: The location to write the output image file.
+        file_name: The name of the output image file. Its extension should
+          match 'device' (e.g. '.jpg' for 'jpeg' or 'ragg', '.png' for 'png').
+        data: The data frame to calculate from. This may also be an R format
+          data frame from `as_r_data_frame`, so that data used for several
+          plots is only converted once.
         date_time: The name of the date column in 'data'.
         elements: The name of the elements column in 'data' to apply the
           function to.
@@ -944,47 +973,28 @@ def histogram_plot(
         title: The text for the title.
         x_title: The text for the x-axis.
         y_title: The text for the y-axis.
+        device: The R graphics device used to write the image file. One of
+          'jpeg' (R's standard JPEG device), 'ragg' (the faster
+          'ragg::agg_jpeg' device), 'png' (R's PNG device, usually quicker to
+          encode than JPEG for plots with large areas of flat colour) or
+          'webp' (the 'ragg::agg_webp' device). 'ragg' and 'webp' require the
+          'ragg' R package.
 
     Returns:
         Nothing.
     """
     # If dates in data frame do not include timezone data, then set to UTC
-    data[date_time] = to_datetime(data[date_time], utc=True)
+    data = __set_utc(data, date_time)
 
     r_params: Dict = __get_r_params(locals())
-    r_plot = r_cdms_products.histogram_plot(
-        data=r_params["data"],
-        date_time=r_params["date_time"],
-        elements=r_params["elements"],
-        station=r_params["station"],
-        facet_by=r_params["facet_by"],
-        position=r_params["position"],
-        colour_bank=r_params["colour_bank"],
-        na_rm=r_params["na_rm"],
-        orientation=r_params["orientation"],
-        show_legend=r_params["show_legend"],
-        width=r_params["width"],
-        facet_nrow=r_params["facet_nrow"],
-        facet_ncol=r_params["facet_ncol"],
-        title=r_params["title"],
-        x_title=r_params["x_title"],
-        y_title=r_params["y_title"],
-    )
-    r_ggplot2.ggsave(
-        filename=file_name,
-        plot=r_plot,
-        device="jpeg",
-        path=path,
-        width=25,
-        height=20,
-        units="cm",
-    )
+    del r_params["file_name"], r_params["path"], r_params["device"]
+    __save_plot("histogram_plot", r_params, file_name, path, 25, 20, device)
 
 
 def inventory_plot(
     path: str,
     file_name: str,
-    data: DataFrame,
+    data: Union[DataFrame, RDataFrame],
     date_time: str,
     elements: List[str],
     station: str = None,
@@ -1023,18 +1033,22 @@ def inventory_plot(
         "key_colours": ["tan3", "blue"],
     },
     coord_flip: bool = False,
+    device: str = "jpeg",
 ):
     """Produce an inventory of available and missing data.
 
     Creates an inventory plot using 'ggplot2' that displays whether a value is
     observed or missing for each element and station given. Takes a data frame
     as an input and the relevant columns to create the plot.
-    Writes the plot to a JPEG file.
+    Writes the plot to an image file, in the format set by 'device'.
 
     Args:
-        path: The location to write the JPEG output file.
-        file_name: The name of the JPEG output file.
-        data: The data frame to calculate from.
+        path: The location to write the output image file.
+        file_name: The name of the output image file. Its extension should
+          match 'device' (e.g. '.jpg' for 'jpeg' or 'ragg', '.png' for 'png').
+        data: The data frame to calculate from. This may also be an R format
+          data frame from `as_r_data_frame`, so that data used for several
+          plots is only converted once.
         date_time: The name of the date column in 'data'.
         elements: The name of the elements column in 'data' to apply the
           function to.
@@ -1095,21 +1109,27 @@ def inventory_plot(
           and rainy days. By default, 'c("Dry", "Rain")'
         key_colours: If 'display_rain_days = TRUE', the colours for dry and
           rainy days. By default, 'c("tan3", "blue"))'
+        device: The R graphics device used to write the image file. One of
+          'jpeg' (R's standard JPEG device), 'ragg' (the faster
+          'ragg::agg_jpeg' device), 'png' (R's PNG device, usually quicker to
+          encode than JPEG for plots with large areas of flat colour) or
+          'webp' (the 'ragg::agg_webp' device). 'ragg' and 'webp' require the
+          'ragg' R package.
 
     Returns:
         Nothing.
     """
     # If dates in data frame do not include timezone data, then set to UTC
-    data[date_time] = to_datetime(data[date_time], utc=True)
+    data = __set_utc(data, date_time)
 
+    data = __get_r_data_frame_with_dates(data)
     r_params: Dict = __get_r_params(locals())
-    r_params["data"] = __convert_posixt_to_r_date(r_params["data"])
 
     # translate none null facet margin parameters to R ggplot margin types
-    if r_params["facet_x_margin"] == r_NULL:
-        r_params["facet_x_margin"] = r_ggplot2.margin(1, 0, 1, 0)
-    if r_params["facet_y_margin"] == r_NULL:
-        r_params["facet_y_margin"] = r_ggplot2.margin(1, 0, 1, 0)
+    if r_params["facet_x_margin"] is r_NULL:
+        r_params["facet_x_margin"] = __r_ggplot2().margin(1, 0, 1, 0)
+    if r_params["facet_y_margin"] is r_NULL:
+        r_params["facet_y_margin"] = __r_ggplot2().margin(1, 0, 1, 0)
 
     # convert the dictionary of R lists, into a named R list of R lists
     #   e.g. with format like 'list(breaks = c(0, 0.85, Inf), labels = c("Dry", "Rain"), key_colours = c("tan3", "blue"))'
@@ -1120,60 +1140,15 @@ def inventory_plot(
             if isinstance(key_list[0], str):
                 r_rain_cats[key] = StrVector(key_list)
             else:
-                r_rain_cats[key] = FloatVector(key_list)
+                r_rain_cats[key] = __get_float_vector(key_list)
     r_params["rain_cats"] = ListVector(r_rain_cats)
 
-    r_plot = r_cdms_products.inventory_plot(
-        data=r_params["data"],
-        date_time=r_params["date_time"],
-        elements=r_params["elements"],
-        station=r_params["station"],
-        year=r_params["year"],
-        doy=r_params["doy"],
-        year_doy_plot=r_params["year_doy_plot"],
-        facet_by=r_params["facet_by"],
-        facet_x_size=r_params["facet_x_size"],
-        facet_y_size=r_params["facet_y_size"],
-        title=r_params["title"],
-        plot_title_size=r_params["plot_title_size"],
-        plot_title_hjust=r_params["plot_title_hjust"],
-        x_title=r_params["x_title"],
-        y_title=r_params["y_title"],
-        x_scale_from=r_params["x_scale_from"],
-        x_scale_to=r_params["x_scale_to"],
-        x_scale_by=r_params["x_scale_by"],
-        y_date_format=r_params["y_date_format"],
-        y_date_scale_by=r_params["y_date_scale_by"],
-        y_date_scale_step=r_params["y_date_scale_step"],
-        facet_scales=r_params["facet_scales"],
-        facet_dir=r_params["facet_dir"],
-        facet_x_margin=r_params["facet_x_margin"],
-        facet_y_margin=r_params["facet_y_margin"],
-        facet_nrow=r_params["facet_nrow"],
-        facet_ncol=r_params["facet_ncol"],
-        missing_colour=r_params["missing_colour"],
-        present_colour=r_params["present_colour"],
-        missing_label=r_params["missing_label"],
-        present_label=r_params["present_label"],
-        display_rain_days=r_params["display_rain_days"],
-        rain=r_params["rain"],
-        rain_cats=r_params["rain_cats"],
-        coord_flip=r_params["coord_flip"],
-    )
-
-    r_ggplot2.ggsave(
-        filename=file_name,
-        plot=r_plot,
-        device="jpeg",
-        path=path,
-        width=25,
-        height=20,
-        units="cm",
-    )
+    del r_params["file_name"], r_params["path"], r_params["device"]
+    __save_plot("inventory_plot", r_params, file_name, path, 25, 20, device)
 
 
 def inventory_table(
-    data: DataFrame,
+    data: Union[DataFrame, RDataFrame, "pyarrow.Table"],
     date_time: str,
     elements: List[str] = [],
     station: str = None,
@@ -1182,14 +1157,19 @@ def inventory_table(
     day: str = None,
     missing_indicator: str = "M",
     observed_indicator: str = "X",
-) -> DataFrame:
+    as_r: bool = False,
+    as_arrow: bool = False,
+) -> Union[DataFrame, RDataFrame, "pyarrow.Table"]:
     """Create Inventory Table.
 
     Returns a table for each cell in a climatic data frame with an indicator to
     show whether the corresponding cell value is missing or observed.
 
     Args:
-        data: The data frame to calculate from.
+        data: The data frame to calculate from. This may also be an R format
+          data frame, e.g. returned by another wrapper with 'as_r' set to True,
+          or a 'pyarrow.Table', which is passed to R without copying when
+          Arrow is available.
         date_time: The name of the date column in 'data'.
         elements: The name of the elements column in 'data' to apply the function to..
         station: The name of the station column in 'data', if the data are
@@ -1205,27 +1185,26 @@ def inventory_table(
           Default 'M'.
         observed_indicator: Indicator to give if the data is observed.
           Default 'X'.
+        as_r: If True, the result is returned as an R format data frame. This
+          avoids converting the result to Python if it is only going to be
+          passed to another wrapper function.
+        as_arrow: If True, the result is returned as a 'pyarrow.Table' rather
+          than a pandas data frame. Requires the 'rpy2-arrow' Python package
+          and the 'arrow' R package.
 
     Returns:
         A data frame indicating if the value is missing or observed.
     """
     # If dates in data frame do not include timezone data, then set to UTC
-    data[date_time] = to_datetime(data[date_time], utc=True)
+    data = __set_utc(data, date_time)
 
+    data = __get_r_data_frame_with_dates(data)
     r_params: Dict = __get_r_params(locals())
-    r_params["data"] = __convert_posixt_to_r_date(r_params["data"])
-    r_data_frame: RDataFrame = r_cdms_products.inventory_table(
-        data=r_params["data"],
-        date_time=r_params["date_time"],
-        elements=r_params["elements"],
-        station=r_params["station"],
-        year=r_params["year"],
-        month=r_params["month"],
-        day=r_params["day"],
-        missing_indicator=r_params["missing_indicator"],
-        observed_indicator=r_params["observed_indicator"],
-    )
-    return __get_data_frame(r_data_frame)
+    del r_params["as_r"], r_params["as_arrow"]
+    r_data_frame: RDataFrame = __r_cdms_products_function("inventory_table")(**r_params)
+    if as_r:
+        return r_data_frame
+    return __get_data_frame(r_data_frame, as_arrow)
 
 
 def output_CPT(
@@ -1265,25 +1244,14 @@ def output_CPT(
         A data frame formatted for use in CPT.
     """
     r_params: Dict = __get_r_params(locals())
-    r_data_frame: RDataFrame = r_cdms_products.output_CPT(
-        data=r_params["data"],
-        lat_lon_data=r_params["lat_lon_data"],
-        station_latlondata=r_params["station_latlondata"],
-        latitude=r_params["latitude"],
-        longitude=r_params["longitude"],
-        station=r_params["station"],
-        year=r_params["year"],
-        element=r_params["element"],
-        long_data=r_params["long_data"],
-        na_code=r_params["na_code"],
-    )
+    r_data_frame: RDataFrame = __r_cdms_products_function("output_CPT")(**r_params)
     return __get_data_frame(r_data_frame)
 
 
 def timeseries_plot(
     path: str,
     file_name: str,
-    data: DataFrame,
+    data: Union[DataFrame, RDataFrame],
     date_time: str,
     elements: List[str],
     station: str = None,
@@ -1299,18 +1267,25 @@ def timeseries_plot(
     title: str = "Timeseries Plot",
     x_title: str = None,
     y_title: str = None,
-):
+    device: str = "jpeg",
+) -> Optional["Image.Image"]:
     """Produce a timeseries graph.
 
     Creates a timeseries plot using 'ggplot2' for each element and station
     given. Takes a data frame as an input and the relevant columns to create
     the plot.
-    Writes the plot to a JPEG file.
+    Writes the plot to an image file, in the format set by 'device', or
+    returns it as an image if 'file_name' is None.
 
     Args:
-        path: The location to write the JPEG output file.
-        file_name: The name of the JPEG output file.
-        data: The data frame to calculate from.
+        path: The location to write the output image file.
+        file_name: The name of the output image file. Its extension should
+          match 'device' (e.g. '.jpg' for 'jpeg' or 'ragg', '.png' for 'png').
+          If None, no file is written to 'path' and the plot is returned as
+          a PIL image.
+        data: The data frame to calculate from. This may also be an R format
+          data frame from `as_r_data_frame`, so that data used for several
+          plots is only converted once.
         date_time: The name of the date column in 'data'.
         elements: The name of the elements column in 'data' to apply
           the function to.
@@ -1340,62 +1315,57 @@ def timeseries_plot(
         title: The text for the title.
         x_title: The text for the x-axis.
         y_title: The text for the y-axis.
+        device: The R graphics device used to write the image file. One of
+          'jpeg' (R's standard JPEG device), 'ragg' (the faster
+          'ragg::agg_jpeg' device), 'png' (R's PNG device, usually quicker to
+          encode than JPEG for plots with large areas of flat colour) or
+          'webp' (the 'ragg::agg_webp' device). 'ragg' and 'webp' require the
+          'ragg' R package.
 
     Returns:
-        Nothing.
+        The plot as a PIL image if 'file_name' is None, else nothing.
     """
     # If dates in data frame do not include timezone data, then set to UTC
-    data[date_time] = to_datetime(data[date_time], utc=True)
+    data = __set_utc(data, date_time)
 
     r_params: Dict = __get_r_params(locals())
-    r_plot = r_cdms_products.timeseries_plot(
-        data=r_params["data"],
-        date_time=r_params["date_time"],
-        elements=r_params["elements"],
-        station=r_params["station"],
-        facet_by=r_params["facet_by"],
-        type=r_params["type"],
-        add_points=r_params["add_points"],
-        add_line_of_best_fit=r_params["add_line_of_best_fit"],
-        se=r_params["se"],
-        add_path=r_params["add_path"],
-        add_step=r_params["add_step"],
-        na_rm=r_params["na_rm"],
-        show_legend=r_params["show_legend"],
-        title=r_params["title"],
-        x_title=r_params["x_title"],
-        y_title=r_params["y_title"],
-    )
-    r_ggplot2.ggsave(filename=file_name, plot=r_plot, device="jpeg", path=path)
+    del r_params["file_name"], r_params["path"], r_params["device"]
+    if file_name is None:
+        return __get_image("timeseries_plot", r_params, device=device)
+    __save_plot("timeseries_plot", r_params, file_name, path, device=device)
 
 
 def windrose(
     path: str,
     file_name: str,
-    data: DataFrame,
+    data: Union[DataFrame, RDataFrame],
     speed: List[float],
     direction: List[float],
     facet_by: List[str] = None,
     n_directions: int = 12,
     n_speeds: int = 5,
-    speed_cuts: List[float] = [],
+    speed_cuts: Union[List[float], numpy.ndarray] = [],
     col_pal: str = "GnBu",
     ggtheme: str = "grey",
     legend_title="Wind Speed",
     calm_wind: float = 0,
     variable_wind: float = 990,
     n_col: int = None,
+    device: str = "jpeg",
 ):
     """Produce a windrose graph from the clifro package.
 
     Creates a windrose plot using 'ggplot2' of wind speed and direction.
     This function is a wrapper of the 'clifro::windrose()' function.
-    Writes the plot to a JPEG file.
+    Writes the plot to an image file, in the format set by 'device'.
 
     Args:
-        path: The location to write the JPEG output file.
-        file_name: The name of the JPEG output file.
-        data: The data frame to calculate from.
+        path: The location to write the output image file.
+        file_name: The name of the output image file. Its extension should
+          match 'device' (e.g. '.jpg' for 'jpeg' or 'ragg', '.png' for 'png').
+        data: The data frame to calculate from. This may also be an R format
+          data frame from `as_r_data_frame`, so that data used for several
+          plots is only converted once.
         speed: A vector containing wind speeds.
         direction: A vector containing wind direction.
         facet_by: Facets used to plot the various windroses.
@@ -1414,43 +1384,90 @@ def windrose(
             Default 0.
         variable_wind: Variable winds (if applicable).
         n_col: The number of columns to plot. Default 1.
+        device: The R graphics device used to write the image file. One of
+          'jpeg' (R's standard JPEG device), 'ragg' (the faster
+          'ragg::agg_jpeg' device), 'png' (R's PNG device, usually quicker to
+          encode than JPEG for plots with large areas of flat colour) or
+          'webp' (the 'ragg::agg_webp' device). 'ragg' and 'webp' require the
+          'ragg' R package.
 
     Returns:
         Nothing.
     """
     r_params: Dict = __get_r_params(locals())
-    r_plot = r_cdms_products.windrose(
-        data=r_params["data"],
-        speed=r_params["speed"],
-        direction=r_params["direction"],
-        facet_by=r_params["facet_by"],
-        n_directions=r_params["n_directions"],
-        n_speeds=r_params["n_speeds"],
-        speed_cuts=r_params["speed_cuts"],
-        col_pal=r_params["col_pal"],
-        ggtheme=r_params["ggtheme"],
-        legend_title=r_params["legend_title"],
-        calm_wind=r_params["calm_wind"],
-        variable_wind=r_params["variable_wind"],
-        n_col=r_params["n_col"],
-    )
-    r_ggplot2.ggsave(
-        filename=file_name,
-        plot=r_plot,
-        device="jpeg",
-        path=path,
-        width=25,
-        height=20,
-        units="cm",
+    del r_params["file_name"], r_params["path"], r_params["device"]
+    __save_plot("windrose", r_params, file_name, path, 25, 20, device)
+
+
+@lru_cache(maxsize=None)
+def __r_cdms_products():
+    """Returns the 'cdms.products' R package.
+
+    The package is only loaded into R the first time that it is needed, so that
+    importing this module does not pay the cost of loading the package.
+    """
+    return packages.importr("cdms.products")
+
+
+@lru_cache(maxsize=None)
+def __r_cdms_products_function(name: str):
+    """Returns the 'cdms.products' R function called 'name'.
+
+    Looking up a function in the package namespace wraps it in a new rpy2
+    function object each time, so each function is only looked up once.
+
+    Args:
+        name: The name of the R function, e.g. 'climatic_summary'.
+
+    Returns:
+        The R function, callable from Python.
+    """
+    return getattr(__r_cdms_products(), name)
+
+
+@lru_cache(maxsize=None)
+def __r_ggplot2():
+    """Returns the 'ggplot2' R package, loading it the first time it is needed."""
+    return packages.importr("ggplot2")
+
+
+@lru_cache(maxsize=None)
+def __r_climatic_summary_batch():
+    """Returns an R function that calls 'climatic_summary' for each group.
+
+    The function is only parsed by R the first time that it is needed.
+    """
+    return r(
+        """
+        function(data, group_col, args) {
+          apply_fn <- if (requireNamespace("future.apply", quietly = TRUE)) {
+            future.apply::future_lapply
+          } else {
+            lapply
+          }
+          summaries <- apply_fn(split(data, data[[group_col]]), function(group) {
+            do.call(cdms.products::climatic_summary, c(list(data = group), args))
+          })
+          has_group_col <- all(vapply(summaries, function(x) group_col %in% names(x), logical(1)))
+          dplyr::bind_rows(summaries, .id = if (has_group_col) NULL else group_col)
+        }
+        """
     )
 
 
+@lru_cache(maxsize=None)
+def __r_bind_rows():
+    """Returns an R function that combines a list of data frames into one."""
+    return r("function(data_frames) dplyr::bind_rows(unname(data_frames))")
+
+
 def __get_r_params(params: Dict) -> Dict:
     """Returns a dictionary of parameters in R format.
 
     Converts each Python parameter in 'params' and converts it into an R
-    parameter suitable for passing to rpy2. Returns the R parameters as a
-    dictionary.
+    parameter suitable for passing to rpy2. Parameters that are already in R
+    format (e.g. an rpy2 data frame) are passed through unchanged. Returns the
+    R parameters as a dictionary.
 
     Args:
         params: A dictionary of Python parameters, normally populated by
@@ -1460,41 +1477,600 @@ def __get_r_params(params: Dict) -> Dict:
         A dictionary of parameters. Each parameter is in an R format suitable
         for passing to rpy2.
     """
-    r_params: Dict = params.copy()
-
-    for key in r_params:
-        if r_params[key] is None:
-            r_params[key] = r_NULL
-        elif isinstance(r_params[key], List):
-            if len(r_params[key]) > 0:
-                if isinstance(r_params[key][0], str):
-                    r_params[key] = StrVector(r_params[key])
-                elif isinstance(r_params[key][0], float):
-                    r_params[key] = FloatVector(r_params[key])
-        elif isinstance(r_params[key], DataFrame):
-            with conversion.localconverter(default_converter + pandas2ri.converter):
-                r_params[key] = conversion.py2rpy(r_params[key])
+    r_params: Dict = {}
+    data_frame_keys: List[str] = []
+    for key, value in params.items():
+        value_type = type(value)
+        if value_type in __R_SCALAR_TYPES:
+            r_params[key] = value
+            continue
+        converter = __R_CONVERTERS.get(value_type)
+        if converter is not None:
+            r_params[key] = converter(value)
+        elif __is_arrow_table(value) and __is_arrow_available():
+            r_params[key] = __arrow_to_r_data_frame(value)
+        elif isinstance(value, DataFrame) or __is_arrow_table(value):
+            data_frame_keys.append(key)
+        else:
+            r_params[key] = value
+
+    if data_frame_keys:
+        # convert all the data frames within a single converter context
+        # (the context is still needed to convert the individual columns)
+        with conversion.localconverter(pandas_converter):
+            for key in data_frame_keys:
+                data_frame = params[key]
+                if __is_arrow_table(data_frame):
+                    data_frame = data_frame.to_pandas()
+                r_params[key] = __pandas_to_r_data_frame(data_frame)
 
     return r_params
 
 
-def __get_data_frame(r_data_frame: RDataFrame) -> DataFrame:
+def __pandas_to_r_data_frame(data_frame: DataFrame) -> RDataFrame:
+    """Converts a pandas data frame into R format without using Arrow.
+
+    Float columns (normally most of the columns in climatic data) are copied
+    straight from their NumPy buffer into an R numeric vector, rather than
+    through 'pandas2ri' which first makes another copy of the column. All
+    other columns are converted by 'pandas_converter'.
+
+    Args:
+        data_frame: A data frame in pandas format.
+
+    Returns:
+        The data frame converted into rpy2 R format.
+    """
+    r_columns: Dict = {}
+    for name, column in data_frame.items():
+        if column.dtype == numpy.float64:
+            values = numpy.ascontiguousarray(column.to_numpy())
+            r_columns[name] = FloatSexpVector.from_memoryview(memoryview(values))
+        else:
+            r_columns[name] = __pandas_series_to_r(name, column)
+    r_data_frame = RDataFrame(r_columns)
+    if not data_frame.index.has_duplicates:
+        r_data_frame.rownames = StrVector([str(index) for index in data_frame.index])
+    return r_data_frame
+
+
+def __pandas_series_to_r(name: str, column: Series):
+    """Converts a pandas column into an R vector, in the same way as 'pandas2ri'.
+
+    If the column cannot be converted (e.g. an object column of mixed types),
+    then a warning is given and the column is converted as strings instead.
+
+    Args:
+        name: The name of the column, used in the warning message.
+        column: A column of a pandas data frame.
+
+    Returns:
+        The column converted into an rpy2 R vector.
+    """
+    try:
+        return pandas_converter.py2rpy(column)
+    except Exception as error:
+        warnings.warn(
+            f"Error while trying to convert the column '{name}'. "
+            f"Fall back to string conversion. The error is: {error}"
+        )
+        return pandas_converter.py2rpy(column.astype("string"))
+
+
+def __get_r_scalar_params(params: Dict) -> Dict:
+    """Returns a dictionary of scalar parameters in R format.
+
+    A faster alternative to `__get_r_params` for parameters that are all
+    scalars (e.g. column names), R objects or None. Only None needs to be
+    converted (into R 'NULL'); everything else is passed through unchanged.
+
+    Args:
+        params: A dictionary of Python parameters, normally populated by
+          calling `locals()`.
+
+    Returns:
+        A dictionary of parameters. Each parameter is in an R format suitable
+        for passing to rpy2.
+    """
+    return {key: r_NULL if value is None else value for key, value in params.items()}
+
+
+def __list_to_r(values: List):
+    """Converts a Python list into an R vector.
+
+    Lists of strings are converted into R character vectors and lists of
+    floats into R numeric vectors. Any other list is returned unchanged.
+
+    Args:
+        values: A Python list.
+
+    Returns:
+        The list in an R format suitable for passing to rpy2.
+    """
+    if len(values) > 0:
+        if isinstance(values[0], str):
+            return __get_str_vector(tuple(values))
+        if isinstance(values[0], float):
+            return __get_cached_float_vector(tuple(values))
+    return values
+
+
+@lru_cache(maxsize=256)
+def __get_cached_float_vector(values: tuple) -> FloatVector:
+    """Returns an R numeric vector, reusing it if it was built before.
+
+    Float list parameters (e.g. 'speed_cuts') are usually short and the same
+    on every call, so the R vectors are cached like the character vectors in
+    `__get_str_vector`.
+
+    Args:
+        values: The numbers to put in the vector.
+
+    Returns:
+        The numbers as an R numeric vector.
+    """
+    return __get_float_vector(values)
+
+
+def __get_float_vector(values) -> FloatVector:
+    """Converts a sequence of numbers into an R numeric vector.
+
+    The numbers are first copied into a contiguous NumPy array, which rpy2 can
+    copy into R as a single block rather than one Python float at a time.
+
+    Args:
+        values: A sequence of numbers.
+
+    Returns:
+        The numbers as an R numeric vector.
+    """
+    return FloatVector(numpy.asarray(values, dtype=numpy.float64))
+
+
+def __ndarray_to_r(values: numpy.ndarray):
+    """Converts a NumPy array into an R vector.
+
+    Numeric arrays are converted into R numeric vectors directly from the array
+    buffer, so long vectors (e.g. wind speed cut points) are not unboxed one
+    element at a time. Arrays of strings are converted into R character
+    vectors. Any other array is returned unchanged.
+
+    Args:
+        values: A one-dimensional NumPy array.
+
+    Returns:
+        The array in an R format suitable for passing to rpy2.
+    """
+    if values.dtype.kind in "iuf":
+        return __get_float_vector(values)
+    if values.dtype.kind == "U":
+        return __get_str_vector(tuple(values.tolist()))
+    return values
+
+
+def __dict_to_r(values: Dict):
+    """Converts a Python dictionary of strings into a named R vector.
+
+    For example, '{"mean": "mean", "n": "dplyr::n"}' is converted into
+    'c(mean = "mean", n = "dplyr::n")'. Dictionaries that contain values other
+    than strings are returned unchanged.
+
+    Args:
+        values: A Python dictionary.
+
+    Returns:
+        The dictionary in an R format suitable for passing to rpy2.
+    """
+    if not values:
+        return StrVector([])
+    names, strings = zip(*values.items())
+    if all(isinstance(string, str) for string in strings):
+        return __get_str_vector(strings, names)
+    return values
+
+
+@lru_cache(maxsize=256)
+def __get_str_vector(
+    strings: tuple, names: tuple = None
+) -> Union[StrSexpVector, StrVector]:
+    """Returns an R character vector, reusing it if it was built before.
+
+    Wrappers are often called repeatedly with the same 'elements' or
+    'summaries' (e.g. once for each station), so the R vectors are cached
+    rather than rebuilt in R on each call.
+
+    Args:
+        strings: The strings to put in the vector.
+        names: The names of the vector elements, if any.
+
+    Returns:
+        The strings as an R character vector.
+    """
+    if names is None:
+        # unnamed vectors only need the low-level constructor, which skips
+        # the high-level 'robjects' wrapping
+        return StrSexpVector(strings)
+    r_vector = StrVector(strings)
+    r_vector.names = StrVector(names)
+    return r_vector
+
+
+def __is_arrow_table(value) -> bool:
+    """Returns True if 'value' is a 'pyarrow.Table'."""
+    return pyarrow is not None and isinstance(value, pyarrow.Table)
+
+
+@lru_cache(maxsize=None)
+def __is_arrow_available() -> bool:
+    """Returns True if data frames can be passed to R in the Arrow format.
+
+    Requires the 'rpy2-arrow' Python package and the 'arrow' R package.
+    """
+    return __HAS_RPY2_ARROW and packages.isinstalled("arrow")
+
+
+@lru_cache(maxsize=None)
+def __r_arrow():
+    """Returns the 'arrow' R package, loading it the first time it is needed."""
+    return packages.importr("arrow")
+
+
+@lru_cache(maxsize=None)
+def __r_as_data_frame():
+    """Returns R's 'as.data.frame' function, looking it up the first time."""
+    return r["as.data.frame"]
+
+
+def __arrow_to_r_data_frame(
+    table: "pyarrow.Table", posixt_to_date: bool = False
+) -> RDataFrame:
+    """Converts an Arrow table into an R format data frame.
+
+    The whole table is passed to R in a single call. The columns are shared
+    with R through the Arrow C data interface rather than being copied one at
+    a time by 'pandas2ri'.
+
+    Args:
+        table: A 'pyarrow.Table'.
+        posixt_to_date: If True, all date-time columns are converted into
+          dates before being passed to R, so that they arrive in R in 'Date'
+          format.
+
+    Returns:
+        The data frame converted into rpy2 R format.
+    """
+    if posixt_to_date:
+        cast_options = pyarrow.compute.CastOptions(
+            pyarrow.date32(), allow_time_truncate=True
+        )
+        for index, field in enumerate(table.schema):
+            if pyarrow.types.is_timestamp(field.type):
+                table = table.set_column(
+                    index,
+                    field.name,
+                    pyarrow.compute.cast(table[index], options=cast_options),
+                )
+    return __r_as_data_frame()(pyarrow_table_to_r_table(table))
+
+
+# types that rpy2 converts into R without any help
+__R_SCALAR_TYPES = frozenset((str, int, float, bool))
+
+# maps the type of a Python parameter to the function that converts it into R
+__R_CONVERTERS: Dict = {
+    type(None): lambda value: r_NULL,
+    list: __list_to_r,
+    tuple: __list_to_r,
+    numpy.ndarray: __ndarray_to_r,
+    dict: __dict_to_r,
+}
+
+
+def __summaries_params_to_r(summaries_params: Dict[str, Dict]) -> ListVector:
+    """Converts the 'summaries_params' parameter into R format.
+
+    Converts to a 2-level deep R-type: one list item for each summary
+    function, and one list of parameters for each summary function
+    e.g. 'list(mean = list(trim = 0.5))'.
+
+    Args:
+        summaries_params: A dictionary containing a dictionary of parameters
+          for each summary function.
+
+    Returns:
+        The parameters as a named R list of named R lists.
+    """
+    # each value's type is part of the cache key, because Python treats values
+    # such as 'True', '1' and '1.0' as equal, but R does not
+    items = tuple(
+        (name, tuple((key, type(value), value) for key, value in params.items()))
+        for name, params in summaries_params.items()
+    )
+    try:
+        return __get_summaries_params_list(items)
+    except TypeError:
+        # a parameter value is unhashable (e.g. a list), so it cannot be cached
+        return __get_summaries_params_list.__wrapped__(items)
+
+
+@lru_cache(maxsize=32)
+def __get_summaries_params_list(items: tuple) -> ListVector:
+    """Returns the R list for the 'summaries_params' in 'items'.
+
+    Callers often pass the same 'summaries_params' many times (e.g. once for
+    each station), so the R lists are cached rather than rebuilt each call.
+
+    Args:
+        items: A tuple of '(summary name, tuple of (parameter name, value
+          type, value) triples)' pairs.
+
+    Returns:
+        The parameters as a named R list of named R lists.
+    """
+    r_summaries_params: Dict[str, ListVector] = {}
+    for name, params in items:
+        r_summaries_params[name] = ListVector(
+            {key: value for key, _, value in params}
+        )
+        r_summaries_params[name].names = [key for key, _, _ in params]
+    r_list = ListVector(r_summaries_params)
+    r_list.names = [name for name, _ in items]
+    return r_list
+
+
+def __get_data_frame(
+    r_data_frame: RDataFrame, as_arrow: bool = False
+) -> Union[DataFrame, "pyarrow.Table"]:
     """Converts an R format data frame into a Python format data frame.
 
-    Converts 'r_data_frame' into a Python data frame and returns it.
+    Converts 'r_data_frame' into a Python data frame and returns it. By
+    default the data frame is converted using 'pandas2ri', so the column types
+    do not depend on whether Arrow is installed. Arrow is only used if
+    'as_arrow' is True.
 
     Args:
         r_data_frame: A data frame in rpy2 R format.
+        as_arrow: If True, the data frame is converted into a 'pyarrow.Table'
+          instead of a pandas data frame. The Arrow columns are shared with R
+          so, unlike building a pandas data frame, no copy is needed.
 
     Returns:
         The data frame converted into Python format.
     """
+    if as_arrow:
+        if not __is_arrow_available():
+            raise ImportError(
+                "'as_arrow' requires the 'rpy2-arrow' Python package and the "
+                "'arrow' R package to be installed."
+            )
+        return rarrow_to_py_table(__r_arrow().as_arrow_table(r_data_frame))
+
     # convert R data frame to pandas data frame
-    with conversion.localconverter(default_converter + pandas2ri.converter):
-        data_frame: DataFrame = conversion.rpy2py(r_data_frame)
+    with conversion.localconverter(pandas_converter):
+        data_frame: DataFrame = pandas2ri.rpy2py_dataframe(r_data_frame)
     return data_frame
 
 
+def __save_plot(
+    plot_function: str,
+    r_params: Dict,
+    file_name: str,
+    path: str = None,
+    width: float = None,
+    height: float = None,
+    device: str = "jpeg",
+):
+    """Creates a 'cdms.products' plot and writes it to an image file.
+
+    The plot is created and saved within a single R call, so the 'ggplot2'
+    plot object never needs to be passed back to Python.
+
+    Args:
+        plot_function: The name of the 'cdms.products' plot function, e.g.
+          'histogram_plot'.
+        r_params: The parameters, in R format, to pass to 'plot_function'.
+        file_name: The name of the output image file.
+        path: The location to write the output image file.
+        width: The width of the plot in cm. If None, the size of the current
+          graphics device is used.
+        height: The height of the plot in cm. If None, the size of the current
+          graphics device is used.
+        device: One of 'jpeg', 'ragg', 'png' or 'webp'.
+    """
+    r_function = __r_cdms_products_function(plot_function)
+    # 'do.call' does not translate the Python parameter names into R names
+    # (e.g. 'na_rm' into 'na.rm'), so translate them in the same way as rpy2
+    r_names: Dict = r_function._prm_translate
+    r_args = ListVector(
+        {r_names.get(key, key): value for key, value in r_params.items()}
+    )
+    __r_save_plot()(
+        file_name,
+        r_function,
+        r_args,
+        r_NULL if path is None else path,
+        NA_Real if width is None else width,
+        NA_Real if height is None else height,
+        device,
+    )
+
+
+@lru_cache(maxsize=None)
+def __r_save_plot():
+    """Returns an R function that creates a plot and saves it as an image file.
+
+    The arguments that are the same for every plot are fixed in R, so they do
+    not need to be converted by rpy2 each time that a plot is saved.
+    """
+    return r(
+        """
+        function(filename, plot_function, args, path, width, height, device) {
+          device <- switch(device, ragg = ragg::agg_jpeg,
+                           webp = ragg::agg_webp, device)
+          ggplot2::ggsave(filename = filename,
+                          plot = do.call(plot_function, args),
+                          device = device, path = path, width = width,
+                          height = height, units = "cm")
+        }
+        """
+    )
+
+
+# the file name suffix of the images written by each plot device
+__PLOT_FILE_SUFFIXES: Dict = {
+    "jpeg": ".jpg",
+    "ragg": ".jpg",
+    "png": ".png",
+    "webp": ".webp",
+}
+
+
+def __get_image(
+    plot_function: str,
+    r_params: Dict,
+    width: float = None,
+    height: float = None,
+    device: str = "jpeg",
+) -> "Image.Image":
+    """Renders a 'cdms.products' plot into an in-memory image.
+
+    The plot is saved to a temporary file which is read back into memory and
+    then deleted, so no file is left on the caller's file system.
+
+    Args:
+        plot_function: The name of the 'cdms.products' plot function, e.g.
+          'timeseries_plot'.
+        r_params: The parameters, in R format, to pass to 'plot_function'.
+        width: The width of the plot in cm.
+        height: The height of the plot in cm.
+        device: One of 'jpeg', 'ragg', 'png' or 'webp'.
+
+    Returns:
+        The plot as a PIL image.
+    """
+    file_handle, file_path = tempfile.mkstemp(suffix=__PLOT_FILE_SUFFIXES[device])
+    os.close(file_handle)
+    try:
+        __save_plot(
+            plot_function,
+            r_params,
+            file_path,
+            width=width,
+            height=height,
+            device=device,
+        )
+        with open(file_path, "rb") as image_file:
+            image_bytes: bytes = image_file.read()
+    finally:
+        os.remove(file_path)
+
+    # only import PIL when it is needed, to keep the module quick to import
+    from PIL import Image
+
+    return Image.open(BytesIO(image_bytes))
+
+
+def __write_climdex_csv(
+    data: DataFrame, date: str, prcp: str, tmax: str, tmin: str, file_path: str
+):
+    """Writes daily data to an RClimDex 'csv' file, without using R.
+
+    Writes the same file as 'cdms.products::export_climdex': one row per day,
+    sorted by date, with the columns year, month, day, precipitation, maximum
+    temperature and minimum temperature, no header, and missing values set to
+    -99.9.
+
+    Args:
+        data: Data frame of daily climatic data in tidy format.
+        date: Name of the date column in 'data'.
+        prcp: Name of the precipitation/rainfall column in 'data'.
+        tmax: Name of the maximum temperature column in 'data'.
+        tmin: Name of the minimum temperature column in 'data'.
+        file_path: The file path and file name to export, without the '.csv'
+          extension.
+    """
+    dates = data[date].dt
+    climdex_data = DataFrame(
+        {
+            "year": dates.year,
+            "month": dates.month,
+            "day": dates.day,
+            "prcp": data[prcp],
+            "tmax": data[tmax],
+            "tmin": data[tmin],
+        }
+    )
+    climdex_data.sort_values(["year", "month", "day"], kind="stable", inplace=True)
+    # '%.15g' matches R's number format (e.g. '15' rather than '15.0')
+    climdex_data.fillna(-99.9).to_csv(
+        file_path + ".csv", header=False, index=False, float_format="%.15g"
+    )
+
+
+def __set_utc(
+    data: Union[DataFrame, RDataFrame, "pyarrow.Table"], column: str
+) -> Union[DataFrame, RDataFrame, "pyarrow.Table"]:
+    """Returns 'data' with a column converted into UTC date-times.
+
+    Date-times without time zone data are assumed to be in UTC. The caller's
+    data frame is not changed. If the column is already in UTC, then 'data' is
+    returned unchanged, otherwise a shallow copy with the converted column is
+    returned, so none of the other columns are copied. R data frames are
+    always returned unchanged.
+
+    Args:
+        data: A data frame in Python, Arrow or rpy2 R format.
+        column: The name of the date-time column in 'data'.
+
+    Returns:
+        The data frame with 'column' in UTC.
+    """
+    if __is_arrow_table(data):
+        index: int = data.schema.get_field_index(column)
+        column_type = data.schema.field(index).type
+        if not pyarrow.types.is_timestamp(column_type) or column_type.tz == "UTC":
+            return data
+        # Arrow stores time zone aware date-times in UTC, so the cast only
+        # changes the type, not the values
+        utc_type = pyarrow.timestamp(column_type.unit, tz="UTC")
+        return data.set_column(index, column, data[column].cast(utc_type))
+    if not isinstance(data, DataFrame):
+        return data
+    if str(getattr(data[column].dtype, "tz", None)) == "UTC":
+        return data
+    data = data.copy(deep=False)
+    data[column] = to_datetime(data[column], utc=True)
+    return data
+
+
+def __get_r_data_frame_with_dates(
+    data: Union[DataFrame, RDataFrame, "pyarrow.Table"]
+) -> RDataFrame:
+    """Converts a data frame into R format, with all dates in 'Date' format.
+
+    If 'data' has no date-time columns, it is converted without any date
+    processing. If 'data' is an Arrow table and Arrow is available, the
+    date-time columns are converted into dates on the Python side using a
+    vectorised cast, so R does not need to rebuild the data frame. Otherwise
+    the data frame is converted using 'pandas2ri' and the Posix dates are then
+    converted in R.
+
+    Args:
+        data: A data frame in Python, Arrow or rpy2 R format.
+
+    Returns:
+        The data frame in rpy2 R format, with all dates in 'Date' format.
+    """
+    if __is_arrow_table(data):
+        if __is_arrow_available():
+            return __arrow_to_r_data_frame(data, posixt_to_date=True)
+        data = data.to_pandas()
+    if isinstance(data, DataFrame):
+        if not any(is_datetime64_any_dtype(dtype) for dtype in data.dtypes):
+            return __get_r_params({"data": data})["data"]
+    return __convert_posixt_to_r_date(__get_r_params({"data": data})["data"])
+
+
 def __convert_posixt_to_r_date(r_data_frame: RDataFrame) -> RDataFrame:
     """Converts all Posix dates in a data frame, to 'Date` format.
 
@@ -1507,7 +2083,25 @@ def __convert_posixt_to_r_date(r_data_frame: RDataFrame) -> RDataFrame:
     Returns:
         The R data frame with all Posix dates converted into 'Date' format.
     """
-    globalenv["df"] = r_data_frame
+    return __r_posixt_to_date()(r_data_frame)
+
+
+@lru_cache(maxsize=None)
+def __r_posixt_to_date():
+    """Returns an R function that converts all Posix dates to 'Date' format.
+
+    The function is only parsed by R once, rather than parsing the R code each
+    time that a data frame is converted. Only the Posix columns are replaced,
+    so the other columns, the column names and the row names are kept as they
+    are, without rebuilding the data frame.
+    """
     return r(
-        'data.frame(lapply(df, function(x) { if (inherits(x, "POSIXt")) as.Date(x) else x }))'
+        """
+        function(df) {
+          for (i in seq_along(df)) {
+            if (inherits(df[[i]], "POSIXt")) df[[i]] <- as.Date(df[[i]])
+          }
+          df
+        }
+        """
     )
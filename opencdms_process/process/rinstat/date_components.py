@@ -1,13 +1,7 @@
-from io import BytesIO
 import logging
 import os
-import rpy2.robjects as ro
-from rpy2.rinterface_lib.callbacks import logger as rpy2_logger
-from rpy2.robjects import pandas2ri
-from rpy2.robjects.conversion import localconverter
-from rpy2.robjects.packages import importr
+from functools import lru_cache
 import numpy as np
-import time
 
 # dates, a column of dates to extract the year from
 # Question: what format will this come in from the database?
@@ -15,45 +9,63 @@ import time
 # e.g. start_month = 8 defines a year from 1 August to 31 July.
 # In such cases year_num returns the calendar year of the beginning of the year 
 # e.g. year_num(["2020/08/10", "2021/01/20"], start_month = 8) = c(2020, 2020)  
-def year_num(dates, start_month = 1):
+# Returns the years as a float64 NumPy array, with NaN for missing dates.
+def year_num(dates, start_month = 1) -> np.ndarray:
+    # rpy2 is imported here, so that importing this module does not start R
+    from rpy2.rinterface_lib.callbacks import logger as rpy2_logger
+
     # Display errors from R, but not warnings
     rpy2_logger.setLevel(logging.ERROR)
 
-    r = ro.r
+    _load_r()
+    # 'dates' is converted by 'as.Date' within the R function.
+    # This may need to change depending on the format of the dates parameter.
+    # The following may be an alternative:
+    # _dates = ro.vectors.DateVector(dates)
+    year_data = _r_year_num()(dates, start_month)
+    # Is this the correct Python structure to return?
+    # Copy the R vector's buffer in one step, rather than element by element
+    year_data = np.array(year_data.memoryview())
+    return year_data
+
+
+# Sources 'yday_366.r' the first time that it is needed, rather than on every
+# call of 'year_num'.
+@lru_cache(maxsize=None)
+def _load_r():
+    import rpy2.robjects as ro
 
     script = os.path.join(
         os.path.dirname(__file__),
         'yday_366.r',
     )
-    r.source(script)
+    ro.r.source(script)
 
-    base = importr("base")
-    # This may need to change depending on the format of the dates parameter.
-    # The following may be an alternative:
-    # _dates = ro.vectors.DateVector(dates)
-    _dates = base.as_Date(dates)
-    _start_month = ro.vectors.IntVector([start_month])
-
-    ro.globalenv['dates'] = _dates
-    ro.globalenv['start_month'] = start_month
-
-    r('''
-
-    library("lubridate")
-    if (!start_month %in% 1:12) stop("start_month must be an integer between 1 and 12. ", start_month, " is invalid.")
-    year_col <- lubridate::year(dates)
-    if (start_month > 1) {
-        # Using a leap year as year to ensure consistent day of year across years.
-        start_doy <- lubridate::yday(as.Date(paste("2000", start_month, 1), format = "%Y %m %d"))
-        doy_col <- as.integer(yday_366(dates))
-        s_doy <- doy_col - start_doy + 1
-        s_year <- year_col
-        s_year[s_doy < 1] <- year_col[s_doy < 1] - 1
-        year_col <- s_year
+
+# Parses the R code of 'year_num' once. The dates and start month are passed
+# as arguments, rather than through variables in R's global environment.
+@lru_cache(maxsize=None)
+def _r_year_num():
+    import rpy2.robjects as ro
+
+    return ro.r('''
+
+    function(dates, start_month) {
+        dates <- as.Date(dates)
+        if (!start_month %in% 1:12) stop("start_month must be an integer between 1 and 12. ", start_month, " is invalid.")
+        year_col <- lubridate::year(dates)
+        if (start_month > 1) {
+            # Using a leap year as year to ensure consistent day of year across years.
+            start_doy <- lubridate::yday(as.Date(paste("2000", start_month, 1), format = "%Y %m %d"))
+            doy_col <- as.integer(yday_366(dates))
+            s_doy <- doy_col - start_doy + 1
+            s_year <- year_col
+            # 'which' skips missing dates, which cannot be used as an index
+            before_start <- which(s_doy < 1)
+            s_year[before_start] <- year_col[before_start] - 1
+            year_col <- s_year
+        }
+        year_col
     }
 
     ''')
-    year_data = ro.globalenv['year_col']
-    # Is this the correct Python structure to return?
-    year_data = np.array(year_data)
-    return year_data
\ No newline at end of file
@@ -0,0 +1,84 @@
+# =================================================================
+#
+# Authors: IDEMS International, Stephen Lloyd
+#
+# Copyright (c) 2022, OpenCDMS Project
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+"""Runs independent `cdms_products` wrapper calls in parallel.
+
+R is single-threaded and the embedded R session is shared by every thread in
+a Python process, so calling the wrappers from a thread pool does not run them
+in parallel. Instead, the calls are shared between worker processes, each with
+its own embedded R session.
+
+The worker processes are started with the 'spawn' method rather than by
+forking, because a forked copy of an already initialised embedded R session is
+not safe to use. Each worker therefore imports `cdms_products` and loads the R
+packages itself, so parallel calls are only worthwhile when there are several
+long-running calls (e.g. exporting files for many stations).
+
+Example:
+    from opencdms_process.process.rinstat import cdms_products, parallel
+
+    if __name__ == "__main__":
+        parallel.call_many(
+            cdms_products.export_climdex,
+            [
+                {"data": data_a, "prcp": "rain", ..., "file_path": "a"},
+                {"data": data_b, "prcp": "rain", ..., "file_path": "b"},
+            ],
+        )
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List
+
+
+def call_many(function: Callable, calls: List[Dict], max_workers: int = None) -> List:
+    """Calls 'function' once for each set of parameters, in parallel.
+
+    Args:
+        function: The wrapper function to call, e.g.
+          `cdms_products.export_climdex`. Must be a module level function, so
+          that it can be passed to the worker processes.
+        calls: A list with one dictionary of parameters for each call. The
+          parameters are pickled to pass them to the worker processes.
+        max_workers: The maximum number of worker processes. If None, one
+          worker is used for each CPU.
+
+    Returns:
+        The result of each call, in the same order as 'calls'.
+
+    Note:
+        The calling script must guard its entry point with
+        `if __name__ == "__main__":`. Each worker process is started with the
+        'spawn' method and re-imports the script's main module, so without
+        the guard each worker would run the script again.
+    """
+    with ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        futures = [executor.submit(function, **params) for params in calls]
+        return [future.result() for future in futures]
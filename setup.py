@@ -43,6 +43,7 @@ setup(
         ],
     },
     install_requires=requirements,
+    extras_require={"arrow": ["pyarrow", "rpy2-arrow"]},
     license="MIT license",
     long_description=readme + "\n\n" + history,
     include_package_data=True,
@@ -86,8 +86,12 @@ actual <- export_cdt(
 
 import filecmp
 import os
+from typing import Dict
 
-from pandas import DataFrame, read_csv
+import pytest
+from pandas import DataFrame, concat, read_csv
+from pandas.testing import assert_frame_equal
+from PIL import Image
 
 from opencdms_process.process.rinstat import cdms_products
 
@@ -95,6 +99,66 @@ TEST_DIR = os.path.dirname(__file__)
 output_path_actual: str = os.path.join(TEST_DIR, "results_actual")
 
 
+def test_as_r_data_frame():
+    data_file: str = os.path.join(TEST_DIR, "data", "daily_niger.csv")
+    daily_niger = read_csv(
+        data_file,
+        parse_dates=["date"],
+        dayfirst=True,
+        na_values="NA",
+    )
+
+    data_file = os.path.join(TEST_DIR, "data", "stations_niger.csv")
+    stations_niger = read_csv(
+        data_file,
+        dayfirst=True,
+        na_values="NA",
+    )
+
+    # an export from an R data frame must match the export from pandas
+    output_file_actual: str = os.path.join(
+        TEST_DIR, "results_actual", "export_cdt_daily_r_actual010.csv"
+    )
+    cdms_products.export_cdt_daily(
+        data=cdms_products.as_r_data_frame(daily_niger, date_time="date"),
+        station="station_name",
+        element="rain",
+        latitude="lat",
+        longitude="long",
+        altitude="alt",
+        type="daily",
+        date_time="date",
+        metadata=stations_niger,
+        file_path=output_file_actual,
+    )
+    _, output_file_expected = __get_output_file_paths("export_cdt_daily_actual010.csv")
+    assert filecmp.cmp(output_file_actual, output_file_expected)
+
+    data_file = os.path.join(TEST_DIR, "data", "niger50.csv")
+    niger50 = read_csv(
+        data_file,
+        parse_dates=["date"],
+        dayfirst=True,
+        na_values="NA",
+    )
+
+    # a plot from an R data frame must match the plot from pandas
+    cdms_products.histogram_plot(
+        path=output_path_actual,
+        file_name="histogram_plot_r_actual010.jpg",
+        data=cdms_products.as_r_data_frame(niger50, date_time="date", to_date=False),
+        date_time="date",
+        elements=["tmax"],
+        station="station_name",
+        facet_by="stations",
+    )
+    _, output_file_expected = __get_output_file_paths("histogram_plot_actual010.jpg")
+    assert filecmp.cmp(
+        os.path.join(output_path_actual, "histogram_plot_r_actual010.jpg"),
+        output_file_expected,
+    )
+
+
 def test_climatic_extremes():
     data_file: str = os.path.join(TEST_DIR, "data", "niger50.csv")
     niger50 = read_csv(
@@ -283,6 +347,157 @@ def test_climatic_summary():
     )
 
 
+def test_climatic_summary_arrow_input_without_rpy2_arrow(monkeypatch):
+    pyarrow = pytest.importorskip("pyarrow")
+    data_file: str = os.path.join(TEST_DIR, "data", "dodoma.csv")
+    dodoma = read_csv(
+        data_file,
+        parse_dates=["date"],
+        dayfirst=True,
+        na_values="NA",
+    )
+
+    # without 'rpy2-arrow', an Arrow table is converted through pandas
+    monkeypatch.setattr(cdms_products, "__HAS_RPY2_ARROW", False)
+    cdms_products.__is_arrow_available.cache_clear()
+    try:
+        actual = cdms_products.climatic_summary(
+            data=pyarrow.Table.from_pandas(dodoma, preserve_index=False),
+            date_time="date",
+            elements=["rain", "tmax"],
+            summaries={"mean": "mean", "sd": "sd", "n_na": "naflex::na_n"},
+            na_rm=True,
+            to="monthly",
+        )
+    finally:
+        cdms_products.__is_arrow_available.cache_clear()
+    assert __is_expected_dataframe(
+        data=actual, file_name="climatic_summary_actual010.csv"
+    )
+
+
+def test_climatic_summary_as_arrow():
+    pyarrow = pytest.importorskip("pyarrow")
+    pytest.importorskip("rpy2_arrow")
+    data_file: str = os.path.join(TEST_DIR, "data", "dodoma.csv")
+    dodoma = read_csv(
+        data_file,
+        parse_dates=["date"],
+        dayfirst=True,
+        na_values="NA",
+    )
+    kwargs = {
+        "date_time": "date",
+        "elements": ["rain", "tmax"],
+        "summaries": {"mean": "mean", "sd": "sd"},
+        "na_rm": True,
+        "to": "overall",
+    }
+
+    # the default pandas result does not depend on whether Arrow is installed
+    actual = cdms_products.climatic_summary(data=dodoma, **kwargs)
+    assert __is_expected_dataframe(
+        data=actual, file_name="climatic_summary_actual005.csv"
+    )
+
+    # the Arrow result holds the same values
+    actual = cdms_products.climatic_summary(data=dodoma, as_arrow=True, **kwargs)
+    assert isinstance(actual, pyarrow.Table)
+    assert __is_expected_dataframe(
+        data=actual.to_pandas(), file_name="climatic_summary_actual005.csv"
+    )
+
+
+def test_climatic_summary_arrow_input():
+    pyarrow = pytest.importorskip("pyarrow")
+    data_file: str = os.path.join(TEST_DIR, "data", "dodoma.csv")
+    dodoma = read_csv(
+        data_file,
+        parse_dates=["date"],
+        dayfirst=True,
+        na_values="NA",
+    )
+
+    # date-times without time zone data are assumed to be in UTC, as for pandas
+    actual = cdms_products.climatic_summary(
+        data=pyarrow.Table.from_pandas(dodoma, preserve_index=False),
+        date_time="date",
+        elements=["rain", "tmax"],
+        summaries={"mean": "mean", "sd": "sd", "n_na": "naflex::na_n"},
+        na_rm=True,
+        to="monthly",
+    )
+    assert __is_expected_dataframe(
+        data=actual, file_name="climatic_summary_actual010.csv"
+    )
+
+
+def test_climatic_summary_batch():
+    data_file: str = os.path.join(TEST_DIR, "data", "rwanda.csv")
+    rwanda = read_csv(
+        data_file,
+        parse_dates=["date"],
+        dayfirst=True,
+        na_values="NA",
+    )
+    kwargs = {
+        "date_time": "date",
+        "elements": ["precip", "tmp_min"],
+        "station": "station_id",
+        "summaries": {"mean": "mean", "sd": "sd"},
+        "na_prop": 0,
+        "to": "monthly",
+    }
+
+    # the batch results must equal calling `climatic_summary` once per station
+    stations = dict(tuple(rwanda.groupby("station_id")))
+    expected = {
+        station: cdms_products.climatic_summary(data=data, **kwargs)
+        for station, data in stations.items()
+    }
+    expected_all: DataFrame = concat(expected.values(), ignore_index=True)
+
+    actual = cdms_products.climatic_summary_batch(
+        data=rwanda, group_col="station_id", **kwargs
+    )
+    assert_frame_equal(actual.reset_index(drop=True), expected_all)
+
+    # split the results into one data frame per station
+    actual = cdms_products.climatic_summary_batch(
+        data=rwanda, group_col="station_id", split=True, **kwargs
+    )
+    __assert_expected_groups(actual, expected)
+
+    # pass the data to R in chunks of stations
+    actual = cdms_products.climatic_summary_batch(
+        data=rwanda, group_col="station_id", chunk_groups=3, **kwargs
+    )
+    assert_frame_equal(actual.reset_index(drop=True), expected_all)
+
+    # pass the data as a dictionary of data frames, one per station
+    actual = cdms_products.climatic_summary_batch(
+        data={
+            station: data.drop(columns="station_id")
+            for station, data in stations.items()
+        },
+        group_col="station_id",
+        **kwargs,
+    )
+    __assert_expected_groups(actual, expected)
+
+    # the dictionary keys are returned unchanged, even if they are not strings
+    actual = cdms_products.climatic_summary_batch(
+        data={
+            int(station): data.drop(columns="station_id")
+            for station, data in stations.items()
+        },
+        group_col="station_id",
+        **kwargs,
+    )
+    assert all(type(key) is int for key in actual)
+    __assert_expected_groups(actual, expected)
+
+
 def test_export_cdt():
     data_file: str = os.path.join(TEST_DIR, "data", "daily_summary_data.csv")
     daily_summary_data = read_csv(
@@ -426,6 +641,22 @@ def test_export_climdex():
     )
     assert __is_expected_file("export_climdex_actual010.csv")
 
+    # the R implementation must write the same file as the pandas implementation
+    output_file_actual: str = os.path.join(
+        TEST_DIR, "results_actual", "export_climdex_r_actual010"
+    )
+    cdms_products.export_climdex(
+        data=daily_niger,
+        date="date",
+        prcp="rain",
+        tmax="tmax",
+        tmin="tmin",
+        file_path=output_file_actual,
+        use_r=True,
+    )
+    _, output_file_expected = __get_output_file_paths("export_climdex_actual010.csv")
+    assert filecmp.cmp(output_file_actual + ".csv", output_file_expected)
+
 
 def test_export_geoclim():
     data_file: str = os.path.join(TEST_DIR, "data", "summary_data_dekad.csv")
@@ -677,6 +908,76 @@ def test_histogram_plot():
     assert __is_expected_file(file_name_actual)
 
 
+def test_histogram_plot_device():
+    data_file: str = os.path.join(TEST_DIR, "data", "niger50.csv")
+    niger50 = read_csv(
+        data_file,
+        parse_dates=["date"],
+        dayfirst=True,
+        na_values="NA",
+    )
+
+    # the plot is written as a PNG file, at the same size as the JPEG file
+    file_name_actual: str = "histogram_plot_actual010.png"
+    cdms_products.histogram_plot(
+        path=output_path_actual,
+        file_name=file_name_actual,
+        data=niger50,
+        date_time="date",
+        elements=["tmax"],
+        station="station_name",
+        facet_by="stations",
+        device="png",
+    )
+    _, output_file_expected = __get_output_file_paths("histogram_plot_actual010.jpg")
+    with Image.open(os.path.join(output_path_actual, file_name_actual)) as actual:
+        with Image.open(output_file_expected) as expected:
+            assert actual.format == "PNG"
+            assert actual.size == expected.size
+
+
+def test_histogram_plot_r_names():
+    data_file: str = os.path.join(TEST_DIR, "data", "niger50.csv")
+    niger50 = read_csv(
+        data_file,
+        parse_dates=["date"],
+        dayfirst=True,
+        na_values="NA",
+    )
+
+    # 'na_rm' is passed to R as 'na.rm'. Removing the missing values silently
+    # does not change the plot.
+    file_name_actual: str = "histogram_plot_na_rm_actual010.jpg"
+    cdms_products.histogram_plot(
+        path=output_path_actual,
+        file_name=file_name_actual,
+        data=niger50,
+        date_time="date",
+        elements=["tmax"],
+        station="station_name",
+        facet_by="stations",
+        na_rm=True,
+    )
+    _, output_file_expected = __get_output_file_paths("histogram_plot_actual010.jpg")
+    assert filecmp.cmp(
+        os.path.join(output_path_actual, file_name_actual), output_file_expected
+    )
+
+    # 'show_legend' is passed to R as 'show.legend'
+    actual = cdms_products.timeseries_plot(
+        path=None,
+        file_name=None,
+        data=niger50,
+        date_time="date",
+        elements=["tmax"],
+        station="station_name",
+        facet_by="stations",
+        na_rm=True,
+        show_legend=False,
+    )
+    assert isinstance(actual, Image.Image)
+
+
 def test_inventory_plot():
     data_file: str = os.path.join(TEST_DIR, "data", "daily_niger.csv")
     daily_niger = read_csv(
@@ -1112,6 +1413,29 @@ def test_timeseries_plot():
     assert __is_expected_file(file_name_actual)
 
 
+def test_timeseries_plot_image():
+    data_file: str = os.path.join(TEST_DIR, "data", "niger50.csv")
+    niger50 = read_csv(
+        data_file,
+        parse_dates=["date"],
+        dayfirst=True,
+        na_values="NA",
+    )
+
+    # if no file name is given, then the plot is returned as an in-memory image
+    actual = cdms_products.timeseries_plot(
+        path=None,
+        file_name=None,
+        data=niger50,
+        date_time="date",
+        elements=["tmax"],
+        station="station_name",
+        facet_by="stations",
+    )
+    assert isinstance(actual, Image.Image)
+    assert __is_expected_image(actual, "timeseries_plot_actual010.jpg")
+
+
 def test_windrose():
     data_file: str = os.path.join(TEST_DIR, "data", "daily_niger.csv")
     daily_niger = read_csv(
@@ -1153,11 +1477,27 @@ def __is_expected_dataframe(data: DataFrame, file_name: str) -> bool:
     return diffs.empty
 
 
+def __assert_expected_groups(actual: Dict, expected: Dict):
+    assert list(actual) == list(expected)
+    for key, data in expected.items():
+        assert_frame_equal(
+            actual[key].reset_index(drop=True),
+            data.reset_index(drop=True),
+            check_dtype=False,
+        )
+
+
 def __is_expected_file(file_name: str) -> bool:
     output_file_actual, output_file_expected = __get_output_file_paths(file_name)
     return filecmp.cmp(output_file_actual, output_file_expected)
 
 
+def __is_expected_image(image: Image.Image, file_name: str) -> bool:
+    _, output_file_expected = __get_output_file_paths(file_name)
+    with Image.open(output_file_expected) as expected:
+        return image.size == expected.size and image.tobytes() == expected.tobytes()
+
+
 def __get_output_file_paths(file_name: str):
     output_file_actual: str = os.path.join(TEST_DIR, "results_actual", file_name)
     output_file_expected: str = os.path.join(
@@ -0,0 +1,58 @@
+# =================================================================
+#
+# Authors: IDEMS International, Stephen Lloyd
+#
+# Copyright (c) 2022, OpenCDMS Project
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+"""Provides a set of tests for the `date_components` module."""
+
+from numpy import nan
+from numpy.testing import assert_array_equal
+from rpy2.robjects import NA_Character
+from rpy2.robjects.vectors import StrVector
+
+from opencdms_process.process.rinstat import date_components
+
+
+def test_year_num():
+    dates = StrVector(["2020/08/10", "2021/01/20"])
+
+    # by default, the year starts on 1 January
+    actual = date_components.year_num(dates)
+    assert_array_equal(actual, [2020, 2021])
+
+    # a year from 1 August to 31 July is given the year that it starts in
+    actual = date_components.year_num(dates, start_month=8)
+    assert_array_equal(actual, [2020, 2020])
+
+    # the first and last days either side of the start month boundary
+    dates = StrVector(["2021-02-28", "2021-03-01", "2020-02-29", "2020-12-31"])
+    actual = date_components.year_num(dates, start_month=3)
+    assert_array_equal(actual, [2020, 2021, 2019, 2020])
+
+    # missing dates give missing years
+    dates = StrVector(["2020/08/10", NA_Character, "2021/07/31"])
+    actual = date_components.year_num(dates, start_month=8)
+    assert_array_equal(actual, [2020, nan, 2020])
@@ -0,0 +1,74 @@
+# =================================================================
+#
+# Authors: IDEMS International, Stephen Lloyd
+#
+# Copyright (c) 2022, OpenCDMS Project
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+"""Provides a set of tests for the `parallel` module."""
+
+import filecmp
+import os
+
+from pandas import read_csv
+
+from opencdms_process.process.rinstat import cdms_products, parallel
+
+TEST_DIR = os.path.dirname(__file__)
+
+
+def test_call_many(tmp_path):
+    data_file: str = os.path.join(TEST_DIR, "data", "daily_niger.csv")
+    daily_niger = read_csv(
+        data_file,
+        parse_dates=["date"],
+        dayfirst=True,
+        na_values="NA",
+    )
+
+    # each call writes the same export using R, from a separate worker process
+    file_paths = [os.path.join(tmp_path, f"export_climdex{index}") for index in (1, 2)]
+    actual = parallel.call_many(
+        cdms_products.export_climdex,
+        [
+            {
+                "data": daily_niger,
+                "date": "date",
+                "prcp": "rain",
+                "tmax": "tmax",
+                "tmin": "tmin",
+                "file_path": file_path,
+                "use_r": True,
+            }
+            for file_path in file_paths
+        ],
+        max_workers=2,
+    )
+    assert actual == [None, None]
+
+    output_file_expected: str = os.path.join(
+        TEST_DIR, "results_expected", "export_climdex_expected010.csv"
+    )
+    for file_path in file_paths:
+        assert filecmp.cmp(file_path + ".csv", output_file_expected)